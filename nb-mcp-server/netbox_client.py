@@ -2,23 +2,83 @@
 """
 NetBox Client Library
 
-This module provides a base class for NetBox client implementations and a REST API implementation.
+This module provides an interface for NetBox client implementations, a REST API
+implementation built on httpx (HTTP/2), and an asynchronous REST API
+implementation built on aiohttp.
 """
 
-import abc
-from typing import Any, Dict, List, Optional, Union
-import requests
+import asyncio
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Sequence, Tuple, Union
+import aiohttp
+import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
 
 
-class NetBoxClientBase(abc.ABC):
+# Transient responses retried by NetBoxRestClient. POST is left out of the
+# retried methods since replaying it can create duplicate objects.
+_RETRY_STATUSES = frozenset([429, 502, 503, 504])
+_RETRY_METHODS = frozenset(['GET', 'PUT', 'PATCH', 'DELETE'])
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.2
+
+
+@lru_cache(maxsize=512)
+def _url(api_url: str, endpoint: str, id: Optional[int] = None) -> str:
+    """Build the full URL for an API request; memoized as the endpoint set is small."""
+    endpoint = endpoint.strip('/')
+    if id is not None:
+        return f"{api_url}/{endpoint}/{id}/"
+    return f"{api_url}/{endpoint}/"
+
+
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """Return a verifying SSL context shared by all clients, so the CA bundle is loaded once."""
+    return httpx.create_ssl_context()
+
+
+def _query_pairs(params: Optional[Dict[str, Any]]) -> Optional[List[Tuple[str, str]]]:
     """
-    Abstract base class for NetBox client implementations.
+    Flatten query parameters into (key, value) string pairs for aiohttp.
     
-    This class defines the interface for CRUD operations that can be implemented
-    either via the REST API or directly via the ORM in a NetBox plugin.
+    yarl rejects bool and None values, so booleans are encoded the way NetBox
+    filters expect ('true'/'false'), None values are dropped and list values
+    are expanded into repeated keys.
+    """
+    if params is None:
+        return None
+    pairs = []
+    for key, value in params.items():
+        for item in value if isinstance(value, (list, tuple)) else (value,):
+            if item is None:
+                continue
+            if isinstance(item, bool):
+                item = 'true' if item else 'false'
+            pairs.append((key, str(item)))
+    return pairs
+
+
+def _chunked(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into consecutive chunks of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class NetBoxClientBase(Protocol):
+    """
+    Interface for NetBox client implementations.
+    
+    This protocol defines the CRUD operations that can be implemented either
+    via the REST API or directly via the ORM in a NetBox plugin. It is checked
+    structurally, so implementations need not inherit from it.
     """
     
-    @abc.abstractmethod
     def get(self, endpoint: str, id: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Retrieve one or more objects from NetBox.
@@ -31,9 +91,8 @@ class NetBoxClientBase(abc.ABC):
         Returns:
             Either a single object dict or a list of object dicts
         """
-        pass
+        ...
     
-    @abc.abstractmethod
     def create(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new object in NetBox.
@@ -45,9 +104,8 @@ class NetBoxClientBase(abc.ABC):
         Returns:
             The created object as a dict
         """
-        pass
+        ...
     
-    @abc.abstractmethod
     def update(self, endpoint: str, id: int, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update an existing object in NetBox.
@@ -60,9 +118,8 @@ class NetBoxClientBase(abc.ABC):
         Returns:
             The updated object as a dict
         """
-        pass
+        ...
     
-    @abc.abstractmethod
     def delete(self, endpoint: str, id: int) -> bool:
         """
         Delete an object from NetBox.
@@ -74,9 +131,8 @@ class NetBoxClientBase(abc.ABC):
         Returns:
             True if deletion was successful, False otherwise
         """
-        pass
+        ...
     
-    @abc.abstractmethod
     def bulk_create(self, endpoint: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Create multiple objects in NetBox.
@@ -88,9 +144,8 @@ class NetBoxClientBase(abc.ABC):
         Returns:
             List of created objects as dicts
         """
-        pass
+        ...
     
-    @abc.abstractmethod
     def bulk_update(self, endpoint: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Update multiple objects in NetBox.
@@ -102,9 +157,8 @@ class NetBoxClientBase(abc.ABC):
         Returns:
             List of updated objects as dicts
         """
-        pass
+        ...
     
-    @abc.abstractmethod
     def bulk_delete(self, endpoint: str, ids: List[int]) -> bool:
         """
         Delete multiple objects from NetBox.
@@ -116,38 +170,46 @@ class NetBoxClientBase(abc.ABC):
         Returns:
             True if deletion was successful, False otherwise
         """
-        pass
+        ...
 
 
-class NetBoxRestClient(NetBoxClientBase):
+class NetBoxRestClient:
     """
     NetBox client implementation using the REST API.
     """
 
+    __slots__ = (
+        'base_url', 'api_url', 'token', 'verify_ssl', 'bulk_chunk_size',
+        'session', '_cache', '_etags', '_cache_lock',
+    )
+
 # # Example of how to use the client
-# client = NetBoxRestClient(
+# with NetBoxRestClient(
 #     url="https://netbox.example.com",
 #     token="your_api_token_here",
 #     verify_ssl=True
-# )
-    
-# # Get all sites
-# sites = client.get("dcim/sites")
-# print(f"Found {len(sites)} sites")
-    
-# # Get a specific site
-# site = client.get("dcim/sites", id=1)
-# print(f"Site name: {site.get('name')}")
-    
-# # Create a new site
-# new_site = client.create("dcim/sites", {
-#     "name": "New Site",
-#     "slug": "new-site",
-#     "status": "active"
-# })
-# print(f"Created site: {new_site.get('name')} (ID: {new_site.get('id')})")
+# ) as client:
+    
+#     # Get all sites
+#     sites = client.get("dcim/sites")
+#     print(f"Found {len(sites)} sites")
+    
+#     # Get a specific site
+#     site = client.get("dcim/sites", id=1)
+#     print(f"Site name: {site.get('name')}")
+    
+#     # Create a new site
+#     new_site = client.create("dcim/sites", {
+#         "name": "New Site",
+#         "slug": "new-site",
+#         "status": "active"
+#     })
+#     print(f"Created site: {new_site.get('name')} (ID: {new_site.get('id')})")
 
-    def __init__(self, url: str, token: str, verify_ssl: bool = True):
+    def __init__(self, url: str, token: str, verify_ssl: bool = True,
+                 cache_ttl: float = 60, cache_maxsize: int = 2048,
+                 bulk_chunk_size: int = 200,
+                 timeout: Union[float, httpx.Timeout, None] = httpx.Timeout(None, connect=10)):
         """
         Initialize the REST API client.
         
@@ -155,24 +217,101 @@ class NetBoxRestClient(NetBoxClientBase):
             url: The base URL of the NetBox instance (e.g., 'https://netbox.example.com')
             token: API token for authentication
             verify_ssl: Whether to verify SSL certificates
+            cache_ttl: Seconds a GET response is served from the local cache
+            cache_maxsize: Maximum number of cached GET responses; 0 disables caching
+            bulk_chunk_size: Maximum number of objects sent in a single bulk request
+            timeout: httpx timeout for each request; by default only connecting
+                is bounded, since large list queries can take a long time
+        
+        Raises:
+            ValueError: If bulk_chunk_size is less than 1
         """
         self.base_url = url.rstrip('/')
         self.api_url = f"{self.base_url}/api"
         self.token = token
         self.verify_ssl = verify_ssl
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Authorization': f'Token {token}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-        })
+        if bulk_chunk_size < 1:
+            raise ValueError(f"bulk_chunk_size must be at least 1, got {bulk_chunk_size}")
+        self.bulk_chunk_size = bulk_chunk_size
+        self._cache = None
+        self._etags = None
+        if cache_maxsize > 0 and cache_ttl > 0:
+            self._cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+            # Validators outlive the TTL so expired entries can be revalidated
+            # with a conditional GET instead of being downloaded again.
+            self._etags = LRUCache(maxsize=cache_maxsize)
+        self._cache_lock = threading.Lock()
+        # HTTP/2 multiplexes concurrent requests (e.g. from get_many()) over a
+        # single TLS connection, so only a small pool is needed. Retryable
+        # status codes are handled in _request(). No explicit transport is
+        # passed, as that would stop httpx honouring HTTPS_PROXY/NO_PROXY.
+        self.session = httpx.Client(
+            headers={
+                'Authorization': f'Token {token}',
+                'Content-Type': 'application/json',
+                'Accept': 'application/json',
+                'Accept-Encoding': 'gzip, br',
+            },
+            http2=True,
+            verify=_ssl_context() if verify_ssl else False,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            follow_redirects=True,
+            timeout=timeout,
+        )
     
     def _build_url(self, endpoint: str, id: Optional[int] = None) -> str:
         """Build the full URL for an API request."""
+        return _url(self.api_url, endpoint, id)
+    
+    def close(self) -> None:
+        """Close the underlying HTTP client and release its pooled connections."""
+        self.session.close()
+    
+    def __enter__(self) -> "NetBoxRestClient":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying transient failures for idempotent methods."""
+        for attempt in range(_RETRY_TOTAL + 1):
+            response = self.session.request(method, url, **kwargs)
+            if (attempt == _RETRY_TOTAL
+                    or method not in _RETRY_METHODS
+                    or response.status_code not in _RETRY_STATUSES):
+                return response
+            retry_after = response.headers.get('Retry-After', '')
+            delay = float(retry_after) if retry_after.isdigit() else _RETRY_BACKOFF * 2 ** attempt
+            time.sleep(delay)
+        return response
+    
+    @staticmethod
+    def _cache_key(endpoint: str, id: Optional[int], params: Optional[Dict[str, Any]]) -> Optional[tuple]:
+        """
+        Build a cache key for a GET request, or None if params cannot be encoded.
+        
+        Params are keyed by their encoded query string, so values that httpx
+        sends differently (e.g. True and 1) never share an entry.
+        """
+        if not params:
+            return (endpoint.strip('/'), id, '')
+        try:
+            query = str(httpx.QueryParams(params))
+        except TypeError:
+            return None
+        return (endpoint.strip('/'), id, query)
+    
+    def _invalidate(self, endpoint: str) -> None:
+        """Drop cached GET responses for an endpoint and the objects beneath it."""
+        if self._cache is None:
+            return
         endpoint = endpoint.strip('/')
-        if id is not None:
-            return f"{self.api_url}/{endpoint}/{id}/"
-        return f"{self.api_url}/{endpoint}/"
+        prefix = f"{endpoint}/"
+        with self._cache_lock:
+            for cache in (self._cache, self._etags):
+                for key in [k for k in cache if k[0] == endpoint or k[0].startswith(prefix)]:
+                    cache.pop(key, None)
     
     def get(self, endpoint: str, id: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
@@ -187,18 +326,161 @@ class NetBoxRestClient(NetBoxClientBase):
             Either a single object dict or a list of object dicts
         
         Raises:
-            requests.HTTPError: If the request fails
+            httpx.HTTPStatusError: If the request fails
         """
-        url = self._build_url(endpoint, id)
-        response = self.session.get(url, params=params, verify=self.verify_ssl)
-        response.raise_for_status()
+        return self._get(endpoint, self._build_url(endpoint, id), id, params)
+    
+    def _get(self, endpoint: str, url: str, id: Optional[int], params: Optional[Dict[str, Any]]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Perform a cached GET against a pre-built URL.
+        
+        The cache holds raw response bytes rather than parsed objects, so every
+        call parses its own copy and callers are free to mutate the result.
+        """
+        key = self._cache_key(endpoint, id, params) if self._cache is not None else None
+        validator = None
+        if key is not None:
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                validator = self._etags.get(key)
+            if cached is not None:
+                return self._parse_get(cached, id)
+        
+        headers = {'If-None-Match': validator[0]} if validator is not None else None
+        response = self._request('GET', url, params=params, headers=headers)
         
-        data = response.json()
+        etag = None
+        if response.status_code == 304 and validator is not None:
+            # Unchanged since the last fetch; reuse the stored body
+            etag, body = validator
+        else:
+            response.raise_for_status()
+            etag = response.headers.get('ETag')
+            body = response.content
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = body
+                if etag:
+                    self._etags[key] = (etag, body)
+        return self._parse_get(body, id)
+    
+    @staticmethod
+    def _parse_get(body: bytes, id: Optional[int]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Parse a GET response body, unwrapping paginated results."""
+        data = orjson.loads(body)
         if id is None and 'results' in data:
             # Handle paginated results
             return data['results']
         return data
     
+    def iter(self, endpoint: str, params: Optional[Dict[str, Any]] = None, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every object of a list endpoint, following pagination.
+        
+        Pages are fetched lazily as the iterator is consumed, so callers that
+        stop early never request the remaining pages.
+        
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            params: Optional query parameters for filtering
+            limit: Optional page size to request from NetBox
+            
+        Yields:
+            Object dicts, in the order NetBox returns them
+        
+        Raises:
+            httpx.HTTPStatusError: If a request fails
+        """
+        url = self._build_url(endpoint)
+        if limit is not None:
+            params = {**(params or {}), 'limit': limit}
+        while url:
+            response = self._request('GET', url, params=params)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            yield from data['results']
+            # The 'next' link already carries the filters and offset
+            url = data.get('next')
+            params = None
+    
+    def get_all(self, endpoint: str, params: Optional[Dict[str, Any]] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve every object of a list endpoint across all pages.
+        
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            params: Optional query parameters for filtering
+            limit: Optional page size to request from NetBox
+            
+        Returns:
+            List of all matching object dicts
+        
+        Raises:
+            httpx.HTTPStatusError: If a request fails
+        """
+        return list(self.iter(endpoint, params=params, limit=limit))
+    
+    def endpoint_api(self, endpoint: str) -> SimpleNamespace:
+        """
+        Build CRUD helpers bound to a single endpoint.
+        
+        The endpoint is normalized and its URLs are built once, so callers
+        that keep the returned namespace around skip that work on every call.
+        Responses go through the same cache and invalidation as get() and the
+        write methods.
+        
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            
+        Returns:
+            A namespace with get(id=None, params=None), create(data),
+            update(id, data) and delete(id) callables
+        """
+        endpoint = endpoint.strip('/')
+        list_url = self._build_url(endpoint)
+        
+        def get(id: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+            url = list_url if id is None else f"{list_url}{id}/"
+            return self._get(endpoint, url, id, params)
+        
+        def create(data: Dict[str, Any]) -> Dict[str, Any]:
+            return self._create(endpoint, list_url, data)
+        
+        def update(id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+            return self._update(endpoint, f"{list_url}{id}/", data)
+        
+        def delete(id: int) -> bool:
+            return self._delete(endpoint, f"{list_url}{id}/")
+        
+        return SimpleNamespace(get=get, create=create, update=update, delete=delete)
+    
+    def get_many(self, specs: Sequence[Tuple[Any, ...]]) -> List[Any]:
+        """
+        Retrieve several independent resources from NetBox concurrently.
+        
+        Each spec is dispatched to get() on a worker thread so the round trips
+        overlap instead of running back to back. No event loop is involved, so
+        this is safe to call from code already running inside one.
+        
+        Args:
+            specs: Sequence of (endpoint, id, params) tuples; trailing
+                elements may be omitted as with get()
+            
+        Returns:
+            One entry per spec, in order: the result of get(), or the
+            exception raised while fetching it
+        """
+        def fetch(spec: Tuple[Any, ...]) -> Any:
+            try:
+                return self.get(*spec)
+            except Exception as exc:
+                return exc
+        
+        if not specs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(specs), 32)) as pool:
+            return list(pool.map(fetch, specs))
+    
     def create(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new object in NetBox via the REST API.
@@ -211,12 +493,16 @@ class NetBoxRestClient(NetBoxClientBase):
             The created object as a dict
             
         Raises:
-            requests.HTTPError: If the request fails
+            httpx.HTTPStatusError: If the request fails
         """
-        url = self._build_url(endpoint)
-        response = self.session.post(url, json=data, verify=self.verify_ssl)
+        return self._create(endpoint, self._build_url(endpoint), data)
+    
+    def _create(self, endpoint: str, url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a new object to a pre-built list URL."""
+        response = self._request('POST', url, content=orjson.dumps(data))
         response.raise_for_status()
-        return response.json()
+        self._invalidate(endpoint)
+        return orjson.loads(response.content)
     
     def update(self, endpoint: str, id: int, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -231,12 +517,16 @@ class NetBoxRestClient(NetBoxClientBase):
             The updated object as a dict
             
         Raises:
-            requests.HTTPError: If the request fails
+            httpx.HTTPStatusError: If the request fails
         """
-        url = self._build_url(endpoint, id)
-        response = self.session.patch(url, json=data, verify=self.verify_ssl)
+        return self._update(endpoint, self._build_url(endpoint, id), data)
+    
+    def _update(self, endpoint: str, url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """PATCH an existing object at a pre-built detail URL."""
+        response = self._request('PATCH', url, content=orjson.dumps(data))
         response.raise_for_status()
-        return response.json()
+        self._invalidate(endpoint)
+        return orjson.loads(response.content)
     
     def delete(self, endpoint: str, id: int) -> bool:
         """
@@ -250,11 +540,15 @@ class NetBoxRestClient(NetBoxClientBase):
             True if deletion was successful, False otherwise
             
         Raises:
-            requests.HTTPError: If the request fails
+            httpx.HTTPStatusError: If the request fails
         """
-        url = self._build_url(endpoint, id)
-        response = self.session.delete(url, verify=self.verify_ssl)
+        return self._delete(endpoint, self._build_url(endpoint, id))
+    
+    def _delete(self, endpoint: str, url: str) -> bool:
+        """DELETE the object at a pre-built detail URL."""
+        response = self._request('DELETE', url)
         response.raise_for_status()
+        self._invalidate(endpoint)
         return response.status_code == 204
     
     def bulk_create(self, endpoint: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -266,15 +560,22 @@ class NetBoxRestClient(NetBoxClientBase):
             data: List of object data to create
             
         Returns:
-            List of created objects as dicts
+            List of created objects as dicts; an empty list sends no request
             
         Raises:
-            requests.HTTPError: If the request fails
+            httpx.HTTPStatusError: If the request fails
         """
         url = f"{self._build_url(endpoint)}bulk/"
-        response = self.session.post(url, json=data, verify=self.verify_ssl)
-        response.raise_for_status()
-        return response.json()
+        results = []
+        try:
+            for chunk in _chunked(data, self.bulk_chunk_size):
+                response = self._request('POST', url, content=orjson.dumps(chunk))
+                response.raise_for_status()
+                results.extend(orjson.loads(response.content))
+        finally:
+            # Earlier chunks may have been applied even if a later one failed
+            self._invalidate(endpoint)
+        return results
     
     def bulk_update(self, endpoint: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -285,15 +586,22 @@ class NetBoxRestClient(NetBoxClientBase):
             data: List of object data to update (must include ID)
             
         Returns:
-            List of updated objects as dicts
+            List of updated objects as dicts; an empty list sends no request
             
         Raises:
-            requests.HTTPError: If the request fails
+            httpx.HTTPStatusError: If the request fails
         """
         url = f"{self._build_url(endpoint)}bulk/"
-        response = self.session.patch(url, json=data, verify=self.verify_ssl)
-        response.raise_for_status()
-        return response.json()
+        results = []
+        try:
+            for chunk in _chunked(data, self.bulk_chunk_size):
+                response = self._request('PATCH', url, content=orjson.dumps(chunk))
+                response.raise_for_status()
+                results.extend(orjson.loads(response.content))
+        finally:
+            # Earlier chunks may have been applied even if a later one failed
+            self._invalidate(endpoint)
+        return results
     
     def bulk_delete(self, endpoint: str, ids: List[int]) -> bool:
         """
@@ -303,14 +611,255 @@ class NetBoxRestClient(NetBoxClientBase):
             endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
             ids: List of IDs to delete
             
+        Returns:
+            True if deletion was successful, False otherwise; an empty list
+            sends no request and returns True
+            
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        url = f"{self._build_url(endpoint)}bulk/"
+        data = [{"id": id} for id in ids]
+        success = True
+        try:
+            for chunk in _chunked(data, self.bulk_chunk_size):
+                response = self._request('DELETE', url, content=orjson.dumps(chunk))
+                response.raise_for_status()
+                success = success and response.status_code == 204
+        finally:
+            # Earlier chunks may have been applied even if a later one failed
+            self._invalidate(endpoint)
+        return success
+
+
+class NetBoxAsyncRestClient:
+    """
+    Asynchronous NetBox client implementation using the REST API.
+
+    Mirrors the NetBoxRestClient interface with coroutine methods so that many
+    independent requests can be in flight at once over a single event loop.
+    The client must be created from within a running event loop and released
+    with aclose(), or used as an async context manager.
+    """
+
+# # Example of how to use the async client
+# async def main():
+#     async with NetBoxAsyncRestClient(
+#         url="https://netbox.example.com",
+#         token="your_api_token_here",
+#         verify_ssl=True
+#     ) as client:
+#         sites = await client.get("dcim/sites")
+#         print(f"Found {len(sites)} sites")
+#
+# asyncio.run(main())
+
+    def __init__(self, url: str, token: str, verify_ssl: bool = True, bulk_chunk_size: int = 200):
+        """
+        Initialize the asynchronous REST API client.
+        
+        Args:
+            url: The base URL of the NetBox instance (e.g., 'https://netbox.example.com')
+            token: API token for authentication
+            verify_ssl: Whether to verify SSL certificates
+            bulk_chunk_size: Maximum number of objects sent in a single bulk request
+        
+        Raises:
+            ValueError: If bulk_chunk_size is less than 1
+        """
+        self.base_url = url.rstrip('/')
+        self.api_url = f"{self.base_url}/api"
+        self.token = token
+        self.verify_ssl = verify_ssl
+        if bulk_chunk_size < 1:
+            raise ValueError(f"bulk_chunk_size must be at least 1, got {bulk_chunk_size}")
+        self.bulk_chunk_size = bulk_chunk_size
+        # aiohttp treats ssl=None as "use default verification" and
+        # ssl=False as "skip verification".
+        self.session = aiohttp.ClientSession(
+            headers={
+                'Authorization': f'Token {token}',
+                'Content-Type': 'application/json',
+                'Accept': 'application/json',
+                'Accept-Encoding': 'gzip, br',
+            },
+            connector=aiohttp.TCPConnector(limit=100, ssl=None if verify_ssl else False),
+        )
+    
+    def _build_url(self, endpoint: str, id: Optional[int] = None) -> str:
+        """Build the full URL for an API request."""
+        return _url(self.api_url, endpoint, id)
+    
+    async def aclose(self) -> None:
+        """Close the underlying aiohttp session and release its connector."""
+        await self.session.close()
+    
+    async def __aenter__(self) -> "NetBoxAsyncRestClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    async def _bulk_chunk(self, method: str, url: str, chunk: List[Dict[str, Any]]) -> Any:
+        """Send one chunk of a bulk request and return its parsed body, or success for DELETE."""
+        async with self.session.request(method, url, data=orjson.dumps(chunk)) as response:
+            response.raise_for_status()
+            if method == 'DELETE':
+                return response.status == 204
+            return orjson.loads(await response.read())
+    
+    async def get(self, endpoint: str, id: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Retrieve one or more objects from NetBox via the REST API.
+        
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: Optional ID to retrieve a specific object
+            params: Optional query parameters for filtering
+            
+        Returns:
+            Either a single object dict or a list of object dicts
+        
+        Raises:
+            aiohttp.ClientResponseError: If the request fails
+        """
+        url = self._build_url(endpoint, id)
+        async with self.session.get(url, params=_query_pairs(params)) as response:
+            response.raise_for_status()
+            data = orjson.loads(await response.read())
+        if id is None and 'results' in data:
+            # Handle paginated results
+            return data['results']
+        return data
+    
+    async def get_many(self, specs: Sequence[Tuple[Any, ...]]) -> List[Any]:
+        """
+        Retrieve several independent resources from NetBox concurrently.
+        
+        Args:
+            specs: Sequence of (endpoint, id, params) tuples; trailing
+                elements may be omitted as with get()
+            
+        Returns:
+            One entry per spec, in order: the result of get(), or the
+            exception raised while fetching it
+        """
+        tasks = [asyncio.create_task(self.get(*spec)) for spec in specs]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def create(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new object in NetBox via the REST API.
+        
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            data: Object data to create
+            
+        Returns:
+            The created object as a dict
+            
+        Raises:
+            aiohttp.ClientResponseError: If the request fails
+        """
+        url = self._build_url(endpoint)
+        async with self.session.post(url, data=orjson.dumps(data)) as response:
+            response.raise_for_status()
+            return orjson.loads(await response.read())
+    
+    async def update(self, endpoint: str, id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update an existing object in NetBox via the REST API.
+        
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: ID of the object to update
+            data: Object data to update
+            
+        Returns:
+            The updated object as a dict
+            
+        Raises:
+            aiohttp.ClientResponseError: If the request fails
+        """
+        url = self._build_url(endpoint, id)
+        async with self.session.patch(url, data=orjson.dumps(data)) as response:
+            response.raise_for_status()
+            return orjson.loads(await response.read())
+    
+    async def delete(self, endpoint: str, id: int) -> bool:
+        """
+        Delete an object from NetBox via the REST API.
+        
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            id: ID of the object to delete
+            
         Returns:
             True if deletion was successful, False otherwise
             
         Raises:
-            requests.HTTPError: If the request fails
+            aiohttp.ClientResponseError: If the request fails
+        """
+        url = self._build_url(endpoint, id)
+        async with self.session.delete(url) as response:
+            response.raise_for_status()
+            return response.status == 204
+    
+    async def bulk_create(self, endpoint: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create multiple objects in NetBox via the REST API.
+        
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            data: List of object data to create
+            
+        Returns:
+            List of created objects as dicts; an empty list sends no request
+            
+        Raises:
+            aiohttp.ClientResponseError: If the request fails
+        """
+        url = f"{self._build_url(endpoint)}bulk/"
+        chunks = _chunked(data, self.bulk_chunk_size)
+        results = await asyncio.gather(*(self._bulk_chunk('POST', url, c) for c in chunks))
+        return [obj for chunk_result in results for obj in chunk_result]
+    
+    async def bulk_update(self, endpoint: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Update multiple objects in NetBox via the REST API.
+        
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            data: List of object data to update (must include ID)
+            
+        Returns:
+            List of updated objects as dicts; an empty list sends no request
+            
+        Raises:
+            aiohttp.ClientResponseError: If the request fails
+        """
+        url = f"{self._build_url(endpoint)}bulk/"
+        chunks = _chunked(data, self.bulk_chunk_size)
+        results = await asyncio.gather(*(self._bulk_chunk('PATCH', url, c) for c in chunks))
+        return [obj for chunk_result in results for obj in chunk_result]
+    
+    async def bulk_delete(self, endpoint: str, ids: List[int]) -> bool:
+        """
+        Delete multiple objects from NetBox via the REST API.
+        
+        Args:
+            endpoint: The API endpoint (e.g., 'dcim/sites', 'ipam/prefixes')
+            ids: List of IDs to delete
+            
+        Returns:
+            True if deletion was successful, False otherwise; an empty list
+            sends no request and returns True
+            
+        Raises:
+            aiohttp.ClientResponseError: If the request fails
         """
         url = f"{self._build_url(endpoint)}bulk/"
         data = [{"id": id} for id in ids]
-        response = self.session.delete(url, json=data, verify=self.verify_ssl)
-        response.raise_for_status()
-        return response.status_code == 204
+        chunks = _chunked(data, self.bulk_chunk_size)
+        results = await asyncio.gather(*(self._bulk_chunk('DELETE', url, c) for c in chunks))
+        return all(results)